@@ -0,0 +1,173 @@
+# File: __main__.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2025
+# License: GNU GPLv3
+# Created On: 19 Oct 2026
+# Purpose:
+#   Command line entry point of the GenCPNet duplicate: python -m gencpynet <options> <directory>
+# Notes:
+#   Startup time matters (the program is called many times from experiment scripts), so modules are imported only
+#       by the paths needing them: counting only loads counttable (and netcount for uncommon parameters.)
+
+import argparse as ap
+import sys
+from . import __VERSION
+
+EXIT_FAILURE = 1
+
+
+def build_parser() -> ap.ArgumentParser:
+    """
+    Constructs the command line argument parser, accepting all options of the original.
+    :return: An ArgumentParser object.
+    """
+    # -h is the Hamming distance in the original, so help is only available as --help.
+    arg_parser = ap.ArgumentParser(prog="GenCPYNet",
+                                   usage="%(prog)s <options> <directory>",
+                                   description="A program for generating acyclic CP-nets uniformly at random.",
+                                   add_help=False)
+    arg_parser.add_argument("-n",
+                            type=int,
+                            required=True,
+                            help="number of features/nodes [required]")
+    arg_parser.add_argument('-c',
+                            type=int,
+                            default=5,
+                            help="bound on indegree for all nodes (default: 5)")
+    arg_parser.add_argument("--count",
+                            action="store_true",
+                            help="outputs the number of CP-nets (given n, c, d) [No generation]")
+    arg_parser.add_argument("--countdags", "--countdegs",
+                            action="store_true",
+                            help="outputs number of graphs (given n, c) [no generation]",
+                            dest="countdags")
+    arg_parser.add_argument("-d",
+                            type=int,
+                            default=2,
+                            help="domain size, homogeneous for all features (default: 2)")
+    arg_parser.add_argument("-g",
+                            type=int,
+                            default=1,
+                            help="number of CP-nets to generate (default 1)")
+    arg_parser.add_argument("-i",
+                            type=float,
+                            default=0.0,
+                            help="probability that a given rule is missing (default: 0.0)")
+    arg_parser.add_argument("-h",
+                            type=int,
+                            default=0,
+                            help="Hamming distance of outcome pairs (optional and only used in conjunction with the "
+                                 "-t option)")
+    arg_parser.add_argument("-t",
+                            type=int,
+                            default=0,
+                            help="also generates XML files each with a pair of outcomes for dominance testing experiments (default: 0)")
+    arg_parser.add_argument("--max-memory",
+                            type=_memory_size,
+                            default=None,
+                            help="memory budget, e.g. 512M or 4G (default: physical memory). Switches to streaming "
+                                 "output when needed, rejects jobs that cannot fit.",
+                            dest="max_memory")
+    arg_parser.add_argument("-V", "--verbose",
+                            action="store_true",
+                            help="output generation details to standard error for debugging")
+    arg_parser.add_argument("--help",
+                            action="help",
+                            help="show this help message and exit")
+    arg_parser.add_argument("--version",
+                            action="version",
+                            version="%(prog)s " + str(__VERSION) + " based on GenCPNet 0.70")
+    arg_parser.add_argument('output_directory',
+                            nargs="?",
+                            default=".",
+                            help="directory to output the generated XML files to. (default: current directory)")
+    return arg_parser
+
+
+def _memory_size(text: str) -> int:
+    # Defers importing the estimator until a budget is actually given.
+    from .estimate import parse_memory
+    try:
+        return parse_memory(text)
+    except ValueError as err:
+        raise ap.ArgumentTypeError(str(err))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the program.
+    :param argv: The command line arguments, excluding the program name. (default: sys.argv[1:])
+    :return: The exit status.
+    """
+    # Parse provided command line arguments
+    args = build_parser().parse_args(argv)
+
+    # Check if arguments are valid, and potentially reassign
+    # Check in-degree bound
+    if args.c < 0:
+        args.c = 5 if args.n > 6 else args.n-1
+    elif args.c >= args.n:
+        args.c = args.n-1
+
+    # Check number of attributes
+    if args.n < 1:
+        print("Error: Number of nodes n > 0 must be specified.", file=sys.stderr)
+        return EXIT_FAILURE
+    elif args.n > 63:
+        print("Error: Number of nodes n must be less than 64.", file=sys.stderr)
+        return EXIT_FAILURE
+
+    # Check Hamming Distance
+    if args.h < 0 or args.h > args.n:
+        print("Error: Hamming distance must be the range [0, n].", file=sys.stderr)
+        return EXIT_FAILURE
+
+    # Check incompleteness degree
+    if args.i < 0 or args.i >= 1:
+        print("Error: degree of incompleteness must be in range [0.0, 1.0).", file=sys.stderr)
+        return EXIT_FAILURE
+
+    # If only counting the instances, not actually generating anything
+    if args.count or args.countdags:
+        from .counttable import count_cpnets, count_dags
+        if hasattr(sys, "set_int_max_str_digits"):
+            sys.set_int_max_str_digits(0)
+        if args.countdags:
+            print(f"Number of DAGs: {count_dags(args.n, args.c)}")
+        if args.count:
+            print(f"Number of CP-nets: {count_cpnets(args.n, args.c, args.d, args.i)}")
+        return 0
+
+    # Show parameters after alignment
+    if args.verbose:
+        print("Building distribution tables for CP-nets with the following specs:")
+        print(f"Number of nodes: {args.n}")
+        print(f"Bound on in-degree: {args.c}")
+        print(f"Homogeneous domains of size {args.d}")
+        print(f"Probability of incompleteness {args.i}")
+
+    # Check for generation problem feasibility, analytically rather than by allocating.
+    from .estimate import ResourceEstimate, STREAMING, format_bytes, physical_memory
+    estimate = ResourceEstimate(args.n, args.c, args.d, args.i, args.g, args.t)
+    budget = args.max_memory if args.max_memory is not None else physical_memory()
+    if args.verbose:
+        print(estimate.describe())
+    args.mode = estimate.generation_mode(budget)
+    if args.mode is None:
+        if not estimate.representable():
+            print(f"Error: CPTs with {args.d}^{args.c} entries cannot be represented.", file=sys.stderr)
+        else:
+            print(f"Error: not enough memory, generation needs at least "
+                  f"{format_bytes(estimate.peak_bytes(STREAMING))} but the budget is {format_bytes(budget)}.",
+                  file=sys.stderr)
+        print("Aborting generation.", file=sys.stderr)
+        return EXIT_FAILURE
+    elif args.verbose and args.mode == STREAMING:
+        print("Memory budget too small for whole CP-nets, CPTs will be written and released one node at a time.")
+
+    # Continue on main.cc at line 246 once completed with Netcount class.
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
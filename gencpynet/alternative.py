@@ -8,7 +8,7 @@
 # Notes:
 #   Provides a class for alternatives and well as homogenous preference domains.
 from typing import Iterator
-from utils import random_k_subset
+from .utils import random_k_subset
 import random
 
 
@@ -0,0 +1,257 @@
+# File: counttable.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2025
+# License: GNU GPLv3
+# Created On: 19 Oct 2026
+# Purpose:
+#   Precomputed counts of DAGs and CP-nets for common parameters, so counting from the command line is a lookup.
+# Notes:
+#   Tables were produced by NetCount and cover n <= 20, c <= 5 (DAGs), plus d = 2 and complete CPTs (CP-nets.)
+#   Anything else falls back on NetCount, which is only imported when needed.
+
+
+def count_dags(n: int, c: int) -> int:
+    """
+    Counts the labeled DAGs with n nodes and indegree at most c.
+    :param n: The number of nodes.
+    :param c: The bound on indegree.
+    :return: The number of DAGs.
+    """
+    if (n, c) in DAG_COUNTS:
+        return DAG_COUNTS[(n, c)]
+    from .netcount import NetCount
+    return NetCount(n + 1, c + 1).count_bounded_ldag(n, c)
+
+
+def count_cpnets(n: int, c: int, dom_size: int, incomp_chance: float = 0.0) -> int:
+    """
+    Counts the CP-nets with n nodes, indegree at most c and domains of size dom_size.
+    :param n: The number of nodes.
+    :param c: The bound on indegree.
+    :param dom_size: The size of the feature domains.
+    :param incomp_chance: The chance a CPT row is missing. (default: 0.0)
+    :return: The number of CP-nets.
+    """
+    if dom_size == 2 and incomp_chance <= 0.0 and (n, c) in BINARY_CPNET_COUNTS:
+        return BINARY_CPNET_COUNTS[(n, c)]
+    from .netcount import NetCount
+    return NetCount(n + 1, c + 1, dom_size, incomp_chance).count_cpnet(n, c)
+
+
+# DAG_COUNTS[(n, c)]
+DAG_COUNTS = {
+    (1, 0): 1,
+    (2, 0): 1,
+    (2, 1): 3,
+    (3, 0): 1,
+    (3, 1): 16,
+    (3, 2): 25,
+    (4, 0): 1,
+    (4, 1): 125,
+    (4, 2): 443,
+    (4, 3): 543,
+    (5, 0): 1,
+    (5, 1): 1296,
+    (5, 2): 13956,
+    (5, 3): 26566,
+    (5, 4): 29281,
+    (6, 0): 1,
+    (6, 1): 16807,
+    (6, 2): 695902,
+    (6, 3): 2556342,
+    (6, 4): 3605817,
+    (6, 5): 3781503,
+    (7, 0): 1,
+    (7, 1): 262144,
+    (7, 2): 50741797,
+    (7, 3): 435055552,
+    (7, 4): 922125667,
+    (7, 5): 1112308744,
+    (8, 0): 1,
+    (8, 1): 4782969,
+    (8, 2): 5111573805,
+    (8, 3): 120754619365,
+    (8, 4): 448699028115,
+    (8, 5): 698855780891,
+    (9, 0): 1,
+    (9, 1): 100000000,
+    (9, 2): 681834525328,
+    (9, 3): 51350946391960,
+    (9, 4): 385639144907308,
+    (9, 5): 876452953772086,
+    (10, 0): 1,
+    (10, 1): 2357947691,
+    (10, 2): 116541746850536,
+    (10, 3): 31851384417063656,
+    (10, 4): 550354033610486186,
+    (10, 5): 2058132642209399858,
+    (11, 0): 1,
+    (11, 1): 61917364224,
+    (11, 2): 24867348916368729,
+    (11, 3): 27701908834589894664,
+    (11, 4): 1239162282196516271364,
+    (11, 5): 8546493150107614455216,
+    (12, 0): 1,
+    (12, 1): 1792160394037,
+    (12, 2): 6485004673137022903,
+    (12, 3): 32710404937218452511443,
+    (12, 4): 4218307851129172187359238,
+    (12, 5): 59702078304917082343612646,
+    (13, 0): 1,
+    (13, 1): 56693912375296,
+    (13, 2): 2030925802149476408320,
+    (13, 3): 51052570219128509334656640,
+    (13, 4): 20946821366826481815987204765,
+    (13, 5): 671894958534671961285789017712,
+    (14, 0): 1,
+    (14, 1): 1946195068359375,
+    (14, 2): 752596112270275554372288,
+    (14, 3): 102965864527102952655273305600,
+    (14, 4): 147183460897305481090673170274623,
+    (14, 5): 11734701435203569535360122784630609,
+    (15, 0): 1,
+    (15, 1): 72057594037927936,
+    (15, 2): 325867948175560635402364741,
+    (15, 3): 263231815662641254658699835508896,
+    (15, 4): 1425716818054856939853208273478556591,
+    (15, 5): 307884956717534899438808115945528275856,
+    (16, 0): 1,
+    (16, 1): 2862423051509815793,
+    (16, 2): 163084920731472027278428501433,
+    (16, 3): 838931441279561447376573526692337513,
+    (16, 4): 18613862742947741538835925792692296422013,
+    (16, 5): 11795946262719904094635941456064976016505005,
+    (17, 0): 1,
+    (17, 1): 121439531096594251776,
+    (17, 2): 93447554590588740256622779990272,
+    (17, 3): 3285198353982621663759052025190130096512,
+    (17, 4): 321151831724272853683134138351919918602754032,
+    (17, 5): 643712193178149340317620228185978758056132419608,
+    (18, 0): 1,
+    (18, 1): 5480386857784802185939,
+    (18, 2): 60798438336885282039420197804920960,
+    (18, 3): 15606724499262882918201449869755121684670080,
+    (18, 4): 7196582817712684568618469674171011408346605751080,
+    (18, 5): 48945924941346711749073926749632854107013719728142792,
+    (19, 0): 1,
+    (19, 1): 262144000000000000000000,
+    (19, 2): 44585069899893161093128600140930174073,
+    (19, 3): 88936378012521876883622991565923257607924112000,
+    (19, 4): 206259839525357039173940359407135046933706341425002488,
+    (19, 5): 5085410693445580682527629929895653916996967737897918730696,
+    (20, 0): 1,
+    (20, 1): 13248496640331026125580781,
+    (20, 2): 36610712465549732099909478719292348791571,
+    (20, 3): 601865504151534843213728689788964150664040214399911,
+    (20, 4): 7458113057170247442405671590091738298744142125987990734496,
+    (20, 5): 709488747834477428777427156880133111506538887732756900497676320,
+}
+
+# BINARY_CPNET_COUNTS[(n, c)]
+BINARY_CPNET_COUNTS = {
+    (1, 0): 2,
+    (2, 0): 4,
+    (2, 1): 12,
+    (3, 0): 8,
+    (3, 1): 128,
+    (3, 2): 488,
+    (4, 0): 16,
+    (4, 1): 2000,
+    (4, 2): 56240,
+    (4, 3): 481776,
+    (5, 0): 32,
+    (5, 1): 41472,
+    (5, 2): 13126272,
+    (5, 3): 1949838272,
+    (5, 4): 157549032992,
+    (6, 0): 64,
+    (6, 1): 1075648,
+    (6, 2): 5210981248,
+    (6, 3): 20565249583488,
+    (6, 4): 276430262688141888,
+    (6, 5): 4059976627283664056256,
+    (7, 0): 128,
+    (7, 1): 33554432,
+    (7, 2): 3164242658432,
+    (7, 3): 450178673899108352,
+    (7, 4): 1538325471804133027809152,
+    (7, 5): 671314208120601865265065458368000,
+    (8, 0): 256,
+    (8, 1): 1224440064,
+    (8, 2): 2736982569970944,
+    (8, 3): 17795808980963235341568,
+    (8, 4): 20888040995041215279486132982528,
+    (8, 5): 409577536264316300849312971519372914743212800,
+    (9, 0): 512,
+    (9, 1): 51200000000,
+    (9, 2): 3204690019302809600,
+    (9, 3): 1155995257718861065366925312,
+    (9, 4): 588543907724816270622838671908751251456,
+    (9, 5): 695794448088360206163316151841053713227528611004157807616,
+    (10, 0): 1024,
+    (10, 1): 2414538435584,
+    (10, 2): 4888693240376762998784,
+    (10, 3): 115245804730783639925038529552384,
+    (10, 4): 30790436118274715804898510635727151749414692864,
+    (10, 5): 2757803852759099766297550103886157155208468986324591871941319032227840,
+    (11, 0): 2048,
+    (11, 1): 126806761930752,
+    (11, 2): 9431193834129361440663552,
+    (11, 3): 16742568678724633264098218596147740672,
+    (11, 4): 2757178433477139479894600756134013332460468374786793472,
+    (11, 5): 22550838849087812497670630578537462601318154006908623753995811828561719850261905408,
+    (12, 0): 4096,
+    (12, 1): 7340688973975552,
+    (12, 2): 22468400987474022469039255552,
+    (12, 3): 3403210699527888626492531423360647344238592,
+    (12, 4): 397071538690930556909717651385965194072719097210911492011220992,
+    (12, 5): 347317391102544222144736862406471885613994391749655608512202105216459621793118126195172962623488,
+    (13, 0): 8192,
+    (13, 1): 464436530178424832,
+    (13, 2): 64827492269601456707464564047872,
+    (13, 3): 936692074696072955037604855954239061064703541248,
+    (13, 4): 87542942791938402732449025733114109648437155076101212433124463211552768,
+    (13, 5): 9390541105059674683189899735378903845855829265728823870905531473129680575857891329318110407553463048349417472,
+    (14, 0): 16384,
+    (14, 1): 31886460000000000000,
+    (14, 2): 222890916778734197640583278624768000,
+    (14, 3): 339809607044406474931444864855902296500154109624582144,
+    (14, 4): 28389051089937196669078160376469467445237312648745625525738146994822655103451136,
+    (14, 5): 421387580218424793316913051453722465417903590034240549012669488899554045751078457801642027567659337820834516422066108121088,
+    (15, 0): 32768,
+    (15, 1): 2361183241434822606848,
+    (15, 2): 900791435191000882390205677120872808448,
+    (15, 3): 158854190202418912255089855481299258338811935263520008962048,
+    (15, 4): 13100051122559598059898557684929317366743923757080772985083279628992711615733237871116288,
+    (15, 5): 29976896660933381476323401384740683557029996192326706108847999786979391902149636170918558249816913459023394396616241057773454083978166272,
+    (16, 0): 65536,
+    (16, 1): 187591757103747287810048,
+    (16, 2): 4229238658789104695711801230525366114254848,
+    (16, 3): 93875874334076768879162512050642280525050510963337810175479840768,
+    (16, 4): 8365200557259619931645339181917651629205512359981773207164778713171691516050447699263696221831168,
+    (16, 5): 3254007313573638145020475998507332351698378397938068039816650368688460960545358731827184246141125153572822118377035780114401006090372144655856088973312,
+    (17, 0): 131072,
+    (17, 1): 15917322219892801768783872,
+    (17, 2): 22834788967647086283267143727033475116010831872,
+    (17, 3): 68981917674389009328023270271114917265006276275526265614602540503007232,
+    (17, 4): 7218090416520935720138722803683913351651903912813202768213290643188643092893005129628914623911800741036032,
+    (17, 5): 521844011733326713155889645129369007496401889934946299234825666054562069485789576800944955590799856481083750028671485315692296515085009880686985839484610649927974912,
+    (18, 0): 262144,
+    (18, 1): 1436650532447139184230793216,
+    (18, 2): 140531756319698771338169102677519941057894506561536,
+    (18, 3): 62131721202850025898964539835036274222639445080622121144161170328896067862528,
+    (18, 4): 8244820121244830380147561487926303643474882069238169522492426384809710026445889563437036083117006438052467161694208,
+    (18, 5): 120258788370121540541657322096940534129291267298842454105080713367037248583014520965677221760063807094679657230885632780513195775514603489320421336441593142420857078531047546683392,
+    (19, 0): 524288,
+    (19, 1): 137438953472000000000000000000,
+    (19, 2): 978131356962173775806648185487980948436423356252160000,
+    (19, 3): 67736724270066482488607931897761129836370263697075539446908328424834418272347619328,
+    (19, 4): 12245093567339133370137758135956331581313094368392408112560487552695649224625031687917608587163421534041571006681202154274816,
+    (19, 5): 38878478175867949919635019715378631207032625814383121327204397324164956174545063551579590021893675567875511738396003202815220018573503088325765881086252612743676877830530069055258904845080330240,
+    (20, 0): 1048576,
+    (20, 1): 13892055613131746050656993017856,
+    (20, 2): 7646242868729272260136714110889047131925601386301102227456,
+    (20, 3): 88396672415144736118058403570457589657285088696187412029584118442877082555288820678393856,
+    (20, 4): 23275982604792062506425455480861714725735075071074612007719776597511112789567170981843120510586416479424129147918124336211027921207296,
+    (20, 5): 17265493876703707004023932250827145589663539031562390788988392385208709296277496430221395569965048308086910545424745628574542626540741199418723786669228678935702422811051120947490333106830729563436643436724224,
+}
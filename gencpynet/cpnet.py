@@ -7,7 +7,9 @@
 #   A series of classes for handling CP-nets.
 # Notes:
 
-from alternative import Alternative, Domain
+from .alternative import Alternative, Domain
+from typing import Iterator
+from .utils import counter_permutation, counter_uniform, splitmix64
 import itertools
 import random
 
@@ -54,6 +56,20 @@ class CPT:
             return self.__table[alt_project]
         return None
 
+    def indegree(self) -> int:
+        """
+        Gets the indegree of the node associated with this CPT.
+        :return: The number of parents the CPT is conditioned on.
+        """
+        return self.__indegree
+
+    def rows(self) -> Iterator[tuple[str | tuple[int,...], tuple[int,...]]]:
+        """
+        An iterator function for iterating through the rows present in the CPT.
+        :return: Yields (parent values, order) pairs. The key 'default' is used when the indegree is 0.
+        """
+        yield from self.__table.items()
+
     def __is_degen(self):
         """
         Determines if a CPT is degenerate.
@@ -66,7 +82,7 @@ class CPT:
             val_rows = [[] for i in range(self.__domain.feature_domain_size())]
             # Extract and bucket rows based on attribute values
             for key in self.__table.keys():
-                val_rows[key[attr]] = key
+                val_rows[key[attr]].append(key)
             dependent = False
             for top_row in val_rows[0]:
                 matching_rows = []
@@ -83,8 +99,8 @@ class CPT:
                 if dependent:
                     break
             if not dependent:
-                return False
-        return True
+                return True
+        return False
 
     @staticmethod
     def matching_except(lst1: list | tuple, lst2: list | tuple, idx: int) -> bool:
@@ -98,19 +114,167 @@ class CPT:
         return lst1[:idx] == lst2[:idx] and lst1[idx+1:] == lst2[idx+1:]
 
 
+class VirtualCPT:
+    """Class for a Conditional Preference Table whose rows are computed on demand from a seed, never stored."""
+    # Bounds on the certificate search: groups of rows scanned per parent, and seeds tried before giving up.
+    MAX_GROUPS = 4096
+    MAX_RESEEDS = 64
+
+    def __init__(self, indegree: int, incomp_chance: float, domain: Domain, seed: int | None = None):
+        """
+        Creates a random new virtual CPT with the given parameters. Row r is derived from a counter-based generator
+        keyed by (seed, r), so only the seed is kept in memory. Rows are distributed as in CPT.
+        :param indegree: The indegree of the node associated with this CPT.
+        :param incomp_chance: The chance of a row in the CPT being empty.
+        :param domain: The domain of the CPT.
+        :param seed: A 64 bit seed. If None one is drawn from the random module. If no certificate of non-degeneracy is
+            found for the seed (see certificate) it is deterministically replaced, at most MAX_RESEEDS times.
+            (default: None)
+        """
+        self.__indegree = indegree
+        self.__incomp_chance = incomp_chance
+        self.__dom_size = domain.feature_domain_size()
+        if indegree > 0 and self.__dom_size < 2:
+            raise ValueError("Cannot create a non-degenerate CPT with parents over a domain of size < 2.")
+        self.__seed = random.getrandbits(64) if seed is None else int(seed)
+        self.__certificate = self.__find_certificate()
+        reseeds = 0
+        while self.__certificate is None:
+            if reseeds >= VirtualCPT.MAX_RESEEDS:
+                raise ValueError(f"No non-degenerate CPT found after {reseeds} seeds "
+                                 f"(incompleteness {incomp_chance} may be too high.)")
+            self.__seed = splitmix64(self.__seed)
+            self.__certificate = self.__find_certificate()
+            reseeds += 1
+
+    def get_order(self, alt_project: tuple[int,...]) -> tuple[int,...] | None:
+        """
+        Gets the preference order given a projected alternative (only containing pertinent attrs, in proper order) for
+        the CPTs attribute.
+        :param alt_project: A tuple of integer values indicating the required attribute values to make an order
+            determination. If len(alt_project) is 0 then the default is returned.
+        :return: The ordered list of values for the attr the CPT represents. If None is returned then a CPT row does
+            not exist, likely due to incompleteness.
+        """
+        if len(alt_project) != self.__indegree or any(val < 0 or val >= self.__dom_size for val in alt_project):
+            return None
+        row = 0
+        for val in alt_project:
+            row = row * self.__dom_size + int(val)
+        return self.row_order(row)
+
+    def row_order(self, row: int) -> tuple[int,...] | None:
+        """
+        Computes the preference order of a row.
+        :param row: The index of the row, the parent values read as a base d number (first parent most significant.)
+        :return: The ordered values, or None if the row is missing.
+        """
+        # Plain integers, the 64 bit mixing overflows numpy integer types.
+        row = int(row)
+        if self.__indegree > 0 and counter_uniform(self.__seed, row, 0) < self.__incomp_chance:
+            return None
+        return counter_permutation(self.__seed, row, self.__dom_size, 1)
+
+    def indegree(self) -> int:
+        """
+        Gets the indegree of the node associated with this CPT.
+        :return: The number of parents the CPT is conditioned on.
+        """
+        return self.__indegree
+
+    def seed(self) -> int:
+        return self.__seed
+
+    def certificate(self) -> list[tuple[int, int]]:
+        """
+        Gets the certificate of non-degeneracy: for each parent, two present rows which differ only in that parent's
+        value and have different orders.
+        :return: A list of row index pairs, one per parent.
+        """
+        return self.__certificate[:]
+
+    def rows(self) -> Iterator[tuple[str | tuple[int,...], tuple[int,...]]]:
+        """
+        An iterator function for iterating through the rows present in the CPT, computing each as it is needed.
+        :return: Yields (parent values, order) pairs. The key 'default' is used when the indegree is 0.
+        """
+        if self.__indegree == 0:
+            yield 'default', self.row_order(0)
+            return
+        all_rows = itertools.product(range(self.__dom_size), repeat=self.__indegree)
+        for row, key in enumerate(all_rows):
+            order = self.row_order(row)
+            if order is not None:
+                yield key, order
+
+    def __find_certificate(self) -> list[tuple[int, int]] | None:
+        """
+        Searches for a witness of dependence on each parent. Rows are only computed until a witness is found, which
+        almost always happens within the first few groups of rows. At most MAX_GROUPS groups are scanned per parent,
+        so a CPT whose only witnesses lie further is (very rarely) rejected as well.
+        :return: The certificate (see certificate), or None if the CPT is degenerate or no witness was found in time.
+        """
+        certificate = []
+        for attr in range(self.__indegree):
+            weight = self.__dom_size ** (self.__indegree - 1 - attr)
+            witness = None
+            # Each base row has attr set to 0, its group holds the rows which differ from it only at attr.
+            for other in range(min(self.__dom_size ** (self.__indegree - 1), VirtualCPT.MAX_GROUPS)):
+                base = (other // weight) * weight * self.__dom_size + other % weight
+                group = [base + val * weight for val in range(self.__dom_size)]
+                present = [(row, self.row_order(row)) for row in group]
+                present = [(row, order) for row, order in present if order is not None]
+                for row, order in present[1:]:
+                    if order != present[0][1]:
+                        witness = (present[0][0], row)
+                        break
+                if witness is not None:
+                    break
+            if witness is None:
+                return None
+            certificate.append(witness)
+        return certificate
+
+
 class CPNode:
-    def __init__(self, attr: int, parents: list[int], incomp_chance: float, domain: Domain):
+    def __init__(self, attr: int, parents: list[int], incomp_chance: float, domain: Domain, virtual: bool = False):
         """
         Constructor for the CPNode class. Generates a random CPT for the node as well.
         :param attr: The attribute the node is associated with.
         :param parents: The list of parents of the node.
         :param incomp_chance: The chance that a row is missing from the CPT.
         :param domain: The domain of valid alternatives.
+        :param virtual: If True the CPT is a VirtualCPT, computing rows on demand instead of storing d^c of them.
+            (default: False)
         """
         self.__attr = attr
         self.__parents = parents
         self.__domain = domain
-        self.__cpt = CPT(len(parents), incomp_chance, domain)
+        if virtual:
+            self.__cpt = VirtualCPT(len(parents), incomp_chance, domain)
+        else:
+            self.__cpt = CPT(len(parents), incomp_chance, domain)
+
+    def attr(self) -> int:
+        """
+        Gets the attribute the node is associated with.
+        :return: The index of the node's attribute.
+        """
+        return self.__attr
+
+    def parents(self) -> list[int]:
+        """
+        Gets the parents of the node.
+        :return: A copy of the list of parent attributes, in the order the CPT is keyed on.
+        """
+        return self.__parents[:]
+
+    def cpt(self) -> CPT | VirtualCPT:
+        """
+        Gets the CPT of the node.
+        :return: The CPT (or VirtualCPT) object associated with the node.
+        """
+        return self.__cpt
 
     def dominates(self, alt1: Alternative, alt2: Alternative) -> bool | None:
         """
@@ -137,4 +301,71 @@ class CPNode:
         order = self.__cpt.get_order(cpt_proj)
         if order is None:
             return tuple()
-        return order[order.index(alt[self.__attr])+1:]
\ No newline at end of file
+        return order[order.index(alt[self.__attr])+1:]
+
+
+class CPNet:
+    def __init__(self, parents: list[list[int]], incomp_chance: float, domain: Domain, virtual: bool = False):
+        """
+        Constructor for the CPNet class. Generates a random CPT for every node.
+        :param parents: A list, indexed by attribute, of the parents of each attribute. Must describe a DAG.
+        :param incomp_chance: The chance that a row is missing from any CPT.
+        :param domain: The domain of valid alternatives.
+        :param virtual: If True every CPT is a VirtualCPT (for large indegree.) (default: False)
+        """
+        self.__domain = domain
+        self.__nodes = [CPNode(attr, attr_parents, incomp_chance, domain, virtual)
+                        for attr, attr_parents in enumerate(parents)]
+        self.__order = CPNet.topological_sort(parents)
+
+    def size(self) -> int:
+        """
+        Gets the number of nodes in the CP-net.
+        :return: The number of nodes/features.
+        """
+        return len(self.__nodes)
+
+    def domain(self) -> Domain:
+        return self.__domain
+
+    def nodes(self) -> list[CPNode]:
+        """
+        Gets the nodes of the CP-net, indexed by attribute.
+        :return: A list of CPNode objects.
+        """
+        return self.__nodes[:]
+
+    def topological_order(self) -> list[int]:
+        """
+        Gets an ordering of the attributes in which every attribute appears after all its parents.
+        :return: A list of attribute indices.
+        """
+        return self.__order[:]
+
+    def __getitem__(self, attr: int) -> CPNode:
+        return self.__nodes[attr]
+
+    def __len__(self) -> int:
+        return self.size()
+
+    @staticmethod
+    def topological_sort(parents: list[list[int]]) -> list[int]:
+        """
+        Computes a topological ordering of a DAG given as parent lists (Kahn's algorithm.)
+        :param parents: A list, indexed by attribute, of the parents of each attribute.
+        :return: A list of attribute indices in which every attribute appears after all its parents.
+        """
+        children = [[] for _ in range(len(parents))]
+        waiting = [len(attr_parents) for attr_parents in parents]
+        for attr, attr_parents in enumerate(parents):
+            for parent in attr_parents:
+                children[parent].append(attr)
+        order = [attr for attr in range(len(parents)) if waiting[attr] == 0]
+        for attr in order:
+            for child in children[attr]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    order.append(child)
+        if len(order) != len(parents):
+            raise ValueError("Cannot order the nodes of a cyclic CP-net.")
+        return order
@@ -0,0 +1,297 @@
+# File: estimate.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2025
+# License: GNU GPLv3
+# Created On: 19 Oct 2026
+# Purpose:
+#   Analytic estimates of the time, memory and output volume a generation job needs, computed before any work starts.
+#   Replaces the allocate-and-free probe (enough_memory) of main.cc.
+# Notes:
+#   All figures are estimates from closed forms, nothing is allocated. They are meant to be pessimistic.
+#   Counting tables follow Netcount: entries (n, c, j, q) for n' <= n, c' <= c, q <= j <= n', each holding a
+#       count whose size is dominated by gamma(k) <= (d! + 1)^(d^k) (the number of CPTs with k parents.)
+#   Python object sizes are taken from sys.getsizeof so they track the running interpreter.
+
+import math
+import os
+import sys
+
+FULL = "full"
+STREAMING = "streaming"
+
+# Python object overheads
+_INT_BYTES = sys.getsizeof(0)
+_INT_DIGIT_BYTES = sys.getsizeof(2 ** 30) - _INT_BYTES
+_INT_DIGIT_BITS = 30
+_TUPLE_BYTES = sys.getsizeof(())
+_SLOT_BYTES = sys.getsizeof((0,)) - _TUPLE_BYTES
+_FLOAT_BYTES = sys.getsizeof(0.0)
+# A dict entry (hash, key, value) plus its index slot, scaled for a 2/3 load factor.
+_DICT_ENTRY_BYTES = 3 * _SLOT_BYTES * 3 // 2 + _SLOT_BYTES
+
+# Rough cost of building the tables: interpreter overhead per (s, t) term of the recurrence, plus big integer
+# multiplication throughput in (30 bit digit) operations per second. Fitted against NetCount.count_cpnet over every
+# (n', c') with n' <= n, c' <= c (as main.cc), for n = 15..50, c = 3..12, d = 2..4: within 0.74x-1.28x of measured.
+_SECONDS_PER_TERM = 1.6e-6
+_DIGIT_OPS_PER_SECOND = 6.4e8
+
+# XML sizes, following dc_and_cpts_to_xml and Outcomes::xmlout (digits are added separately.)
+_XML_HEADER_BYTES = len("<PREFERENCE-SPECIFICATION>\n\n") + len("</PREFERENCE-SPECIFICATION>\n")
+_XML_VARIABLE_BYTES = len("<PREFERENCE-VARIABLE>\n <VARIABLE-NAME>x</VARIABLE-NAME>\n</PREFERENCE-VARIABLE>\n\n")
+_XML_DOMAIN_VALUE_BYTES = len(" <DOMAIN-VALUE></DOMAIN-VALUE>\n")
+_XML_STATEMENT_BYTES = len("<PREFERENCE-STATEMENT>\n  <STATEMENT-ID>p_</STATEMENT-ID>\n"
+                           "  <PREFERENCE-VARIABLE>x</PREFERENCE-VARIABLE>\n</PREFERENCE-STATEMENT>\n\n")
+_XML_CONDITION_BYTES = len("  <CONDITION>x=</CONDITION>\n")
+_XML_PREFERENCE_BYTES = len("  <PREFERENCE>:</PREFERENCE>\n")
+_XML_QUERY_BYTES = len("<PREFERENCE-QUERY>\n  <PREFERENCE-SPECIFICATION-FILENAME></PREFERENCE-SPECIFICATION-FILENAME>\n"
+                       "  <QUERY-TYPE>DOMINANCE</QUERY-TYPE>\n</PREFERENCE-QUERY>\n") + 40
+_XML_OUTCOME_BYTES = len("  <OUTCOME>\n    <LABEL>BETTER</LABEL>\n  </OUTCOME>\n")
+_XML_ASSIGNMENT_BYTES = len("    <ASSIGNMENT>\n      <PREFERENCE-VARIABLE>x</PREFERENCE-VARIABLE>\n"
+                            "      <VALUATION></VALUATION>\n    </ASSIGNMENT>\n")
+
+_MEMORY_SUFFIXES = {"": 1, "B": 1, "K": 2 ** 10, "M": 2 ** 20, "G": 2 ** 30, "T": 2 ** 40}
+
+
+def parse_memory(text: str) -> int:
+    """
+    Parses a memory size such as 512M, 4G or 1073741824.
+    :param text: A finite non-negative number optionally followed by one of the suffixes B, K, M, G, T (powers of
+        1024.)
+    :return: The size in bytes.
+    """
+    clean = text.strip().upper()
+    if clean.endswith("IB"):
+        clean = clean[:-2]
+    suffix = clean[-1:] if clean[-1:].isalpha() else ""
+    try:
+        amount = float(clean[:len(clean) - len(suffix)])
+    except ValueError:
+        raise ValueError(f"Cannot parse memory size '{text}'.")
+    if suffix not in _MEMORY_SUFFIXES or not math.isfinite(amount) or amount < 0:
+        raise ValueError(f"Cannot parse memory size '{text}'.")
+    return int(amount * _MEMORY_SUFFIXES[suffix])
+
+
+def format_bytes(size: float) -> str:
+    """
+    Formats a number of bytes for humans.
+    :param size: The number of bytes.
+    :return: A string such as "1.5 GiB".
+    """
+    for unit in ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]:
+        if size < 1024 or unit == "PiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+
+
+def physical_memory() -> int | None:
+    """
+    Finds the amount of physical memory of the machine, if the platform exposes it.
+    :return: The number of bytes of physical memory, or None if unknown.
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _int_bytes(bits: float) -> float:
+    """
+    Estimates the size of a Python integer.
+    :param bits: The number of bits of the integer.
+    :return: The number of bytes used by the integer object.
+    """
+    return _INT_BYTES + math.ceil(bits / _INT_DIGIT_BITS) * _INT_DIGIT_BYTES
+
+
+def _st_terms(c: int, j: int, q: int) -> int:
+    """
+    Counts the (s, t) terms of Netcount's recurrence at entry (n, c, j, q): s <= min(c, q), t <= min(c - s, j - q).
+    :param c: The bound on indegree.
+    :param j: The position in the DAG code.
+    :param q: The number of nodes seen so far.
+    :return: The number of terms, which is also the number of rows of the entry's distribution.
+    """
+    top = min(c, q)
+    # For s <= c - (j - q) the bound on t is j - q, above that it is c - s.
+    flat = max(0, min(top, c - (j - q)) + 1)
+    low = c - top + 1
+    high = c - flat + 1
+    return flat * (j - q + 1) + (high + low) * (high - low + 1) // 2
+
+
+def _multiply_ops(bits1: float, bits2: float) -> float:
+    """
+    Estimates the cost of multiplying two big integers (Karatsuba, splitting the longer one into chunks.)
+    :param bits1: The bits of one factor.
+    :param bits2: The bits of the other factor.
+    :return: The number of digit operations.
+    """
+    short = max(1.0, min(bits1, bits2) / _INT_DIGIT_BITS)
+    long = max(1.0, max(bits1, bits2) / _INT_DIGIT_BITS)
+    return (long / short) * short ** math.log2(3)
+
+
+class ResourceEstimate:
+    def __init__(self, nodes: int, indegree: int, dom_size: int, incomp_chance: float = 0.0, count: int = 1,
+                 test_pairs: int = 0):
+        """
+        Constructor for the ResourceEstimate class. Computes every estimate up front, in O(n^2 * c) time.
+        :param nodes: The number of nodes in each CP-net (n.)
+        :param indegree: The bound on indegree (c.)
+        :param dom_size: The size of the feature domains (d.)
+        :param incomp_chance: The chance of a CPT row being missing (i.)
+        :param count: The number of CP-nets to generate (g.)
+        :param test_pairs: The number of dominance testing pairs per CP-net (t.)
+        """
+        self.__nodes = nodes
+        self.__indegree = min(indegree, max(nodes - 1, 0))
+        self.__dom_size = dom_size
+        self.__incomp_chance = incomp_chance
+        self.__count = count
+        self.__test_pairs = test_pairs
+        self.__representable = dom_size ** self.__indegree <= sys.maxsize
+        if self.__representable:
+            self.__build_tables()
+
+    def representable(self) -> bool:
+        """
+        Determines if the CPT size d^c can even be represented as an index (the "are you joking" check of main.cc.)
+        :return: True iff d^c fits in a machine sized integer.
+        """
+        return self.__representable
+
+    def cpt_rows(self, parents: int) -> int:
+        """
+        Gets the number of rows of a complete CPT.
+        :param parents: The number of parents of the node.
+        :return: The number of rows, d^parents.
+        """
+        return self.__dom_size ** parents
+
+    def cpt_bytes(self, parents: int | None = None) -> float:
+        """
+        Estimates the memory used by one CPT (see cpnet.CPT), counting expected missing rows.
+        :param parents: The number of parents of the node. (default: the bound on indegree)
+        :return: The expected number of bytes.
+        """
+        if parents is None:
+            parents = self.__indegree
+        rows = self.cpt_rows(parents) * (1.0 - self.__incomp_chance) if parents > 0 else 1
+        key_bytes = _TUPLE_BYTES + parents * _SLOT_BYTES
+        order_bytes = _TUPLE_BYTES + self.__dom_size * _SLOT_BYTES
+        return sys.getsizeof({}) + rows * (_DICT_ENTRY_BYTES + key_bytes + order_bytes)
+
+    def network_bytes(self) -> float:
+        """
+        Estimates the memory used by the CPTs of one CP-net, assuming every node has as many parents as allowed.
+        :return: The number of bytes.
+        """
+        return sum(self.cpt_bytes(min(node, self.__indegree)) for node in range(self.__nodes))
+
+    def table_bytes(self) -> float:
+        """
+        Estimates the memory used by the counting and distribution tables.
+        :return: The number of bytes.
+        """
+        return self.__table_bytes
+
+    def table_seconds(self) -> float:
+        """
+        Estimates the time needed to build the counting tables, within roughly 0.7x-1.3x of the measured NetCount
+        build. The distribution tables (NetCount.get_cpnet_cdf) are not implemented yet, so their cost is not included.
+        :return: The number of seconds.
+        """
+        return self.__table_iterations * _SECONDS_PER_TERM + self.__table_ops / _DIGIT_OPS_PER_SECOND
+
+    def output_bytes(self) -> float:
+        """
+        Estimates the total size of the XML files written (CP-nets and dominance testing pairs.)
+        :return: The number of bytes.
+        """
+        digits = len(str(self.__nodes))
+        value_digits = len(str(self.__dom_size))
+        per_net = _XML_HEADER_BYTES + self.__nodes * (_XML_VARIABLE_BYTES + digits
+                                                      + self.__dom_size * (_XML_DOMAIN_VALUE_BYTES + value_digits))
+        preferences = (self.__dom_size - 1) * (_XML_PREFERENCE_BYTES + 2 * value_digits)
+        for node in range(self.__nodes):
+            parents = min(node, self.__indegree)
+            rows = self.cpt_rows(parents) * (1.0 - self.__incomp_chance) if parents > 0 else 1
+            row_digits = len(str(self.cpt_rows(parents)))
+            conditions = parents * (_XML_CONDITION_BYTES + digits + value_digits)
+            per_net += rows * (_XML_STATEMENT_BYTES + 2 * digits + row_digits + conditions + preferences)
+        per_pair = (_XML_QUERY_BYTES
+                    + 2 * (_XML_OUTCOME_BYTES + self.__nodes * (_XML_ASSIGNMENT_BYTES + digits + value_digits)))
+        return self.__count * (per_net + self.__test_pairs * per_pair)
+
+    def peak_bytes(self, mode: str = FULL) -> float:
+        """
+        Estimates the peak memory of a generation job.
+        :param mode: FULL keeps a whole CP-net in memory before writing it, STREAMING writes and releases each CPT
+            as soon as it is generated.
+        :return: The number of bytes.
+        """
+        if mode == FULL:
+            return self.__table_bytes + self.network_bytes()
+        return self.__table_bytes + self.cpt_bytes()
+
+    def generation_mode(self, max_memory: int | None) -> str | None:
+        """
+        Picks the cheapest generation mode which fits in the memory budget.
+        :param max_memory: The memory budget in bytes. None means no budget.
+        :return: FULL or STREAMING, or None if the job cannot fit in the budget.
+        """
+        if not self.__representable:
+            return None
+        if max_memory is None or self.peak_bytes(FULL) <= max_memory:
+            return FULL
+        if self.peak_bytes(STREAMING) <= max_memory:
+            return STREAMING
+        return None
+
+    def describe(self) -> str:
+        """
+        Creates a human readable summary of the estimates.
+        :return: A multi-line string.
+        """
+        if not self.__representable:
+            return f"CPTs with {self.__dom_size}^{self.__indegree} rows cannot be represented."
+        return "\n".join([
+            f"Estimated table build time: {self.table_seconds():.2f} s",
+            f"Estimated table memory: {format_bytes(self.table_bytes())}",
+            f"Estimated memory per CPT (c = {self.__indegree}): {format_bytes(self.cpt_bytes())}",
+            f"Estimated memory per CP-net: {format_bytes(self.network_bytes())}",
+            f"Estimated peak memory: {format_bytes(self.peak_bytes(FULL))} (full), "
+            f"{format_bytes(self.peak_bytes(STREAMING))} (streaming)",
+            f"Estimated output volume: {format_bytes(self.output_bytes())}"
+        ])
+
+    def __build_tables(self):
+        """
+        Estimates the table memory and build cost (Netcount's PASCAL, GAMMA, CPNET and the cpnet_dist tables.)
+        """
+        max_n = self.__nodes + 1
+        max_k = self.__indegree + 1
+        choices = math.factorial(self.__dom_size) + (1 if self.__incomp_chance > 0.0 else 0)
+        gamma_bits = [self.__dom_size ** k * math.log2(choices) for k in range(max_k)]
+        pascal_bits = [max(1.0, n) for n in range(max_n)]
+        self.__table_bytes = sum(_int_bytes(bits) for bits in gamma_bits)
+        self.__table_bytes += sum(max_k * _int_bytes(bits) for bits in pascal_bits)
+        self.__table_ops = 0.0
+        self.__table_iterations = 0
+        # main.cc builds the tables of every c' <= c (for cc = 0; cc <= c).
+        for c in range(self.__indegree + 1):
+            # Bits of a count covering nodes 0..j-1 (prefix[j]), entry (n, c, j, q) covers nodes j..n-1.
+            prefix = [0.0]
+            for node in range(max_n):
+                prefix.append(prefix[-1] + gamma_bits[min(node, c)] + math.log2(max(node, 1)) * min(node, c))
+            for j in range(1, max_n):
+                # The (s, t) terms (and distribution rows) of entry (n, c, j, q) do not depend on n.
+                terms = sum(_st_terms(c, j, q) for q in range(j + 1))
+                for n in range(j + 1, max_n):
+                    bits = prefix[n] - prefix[j] + 1
+                    self.__table_bytes += (j + 1) * (_DICT_ENTRY_BYTES + _TUPLE_BYTES + 4 * _SLOT_BYTES
+                                                     + _int_bytes(bits))
+                    self.__table_bytes += terms * (3 * _SLOT_BYTES + _FLOAT_BYTES)
+                    self.__table_iterations += terms
+                    self.__table_ops += terms * _multiply_ops(gamma_bits[c], bits)
@@ -6,55 +6,150 @@
 # Purpose:
 #   A Python implementation of GenCPNet's Netcount class.
 # Notes:
+#   Python integers replace GMP's mpz_class, dictionaries replace the preallocated PASCAL/LDAG/BLDAG/CPNET arrays.
+#   The domain size and degree of incompleteness are parameters instead of the globals DOM_SIZE and DEG_INC.
+#   Translator's note: the original's gamma multiplied counts by the (double) degree of incompleteness, which GMP
+#       truncates to 0. Here any incompleteness > 0 counts CPTs where each row may also be missing (d!+1 choices.)
+#   Kept free of generation and I/O imports, the CLI's counting paths only load this module.
+
+import math
+
 
 class NetCount:
-    def __init__(self, nodes: int, indegree_limit: int):
+    def __init__(self, nodes: int, indegree_limit: int, dom_size: int = 2, incomp_chance: float = 0.0):
         """
         Constructor for the NetCount class.
         :param nodes: The number of nodes in the CP-net.
         :param indegree_limit: The limit on node indegree.
+        :param dom_size: The size of the (homogeneous) feature domains. (default: 2)
+        :param incomp_chance: The chance a CPT row is missing, only whether it is 0 matters for counting. (default: 0.0)
         """
-        pass
+        self.__max_n = nodes
+        self.__max_k = min(nodes - 1, indegree_limit) + 1
+        self.__max_gamma = min(nodes - 1, indegree_limit) + 1
+        self.__dom_size = dom_size
+        self.__incomplete = incomp_chance > 0.0
+        self.init()
 
     def get_max_n(self) -> int:
-        pass
+        return self.__max_n
 
     def get_max_k(self) -> int:
-        pass
+        return self.__max_k
 
     def get_max_gamma(self) -> int:
-        pass
+        return self.__max_gamma
 
     def binomial(self, n: int, k: int) -> int:
-        pass
+        """
+        Computes a binomial coefficient (Knuth's convention: 0 for negative arguments.)
+        :param n: The size of the set.
+        :param k: The size of the subsets.
+        :return: n choose k.
+        """
+        if n < 0 or k < 0:
+            return 0
+        return math.comb(n, k)
 
     def phi(self, n: int, winc: int) -> int:
-        pass
+        """
+        Computes the number of multi-valued functions from n parents to a ranking over the d values.
+        :param n: The number of parents.
+        :param winc: If true a row may also be missing (incompleteness.)
+        :return: (d!)^(d^n), or (d!+1)^(d^n) if winc.
+        """
+        return (math.factorial(self.__dom_size) + (1 if winc else 0)) ** (self.__dom_size ** n)
 
     def gamma(self, k: int):
-        pass
+        """
+        Computes the number of non-degenerate CPTs with k parents (inclusion-exclusion over the parents.)
+        :param k: The number of parents.
+        :return: The number of CPTs which depend on all k parents.
+        """
+        if k not in self.__gamma:
+            self.__gamma[k] = sum((-1) ** (k - idx) * self.binomial(k, idx) * self.phi(idx, self.__incomplete)
+                                  for idx in range(k + 1))
+        return self.__gamma[k]
 
     def count_ldag(self, n: int, j: int = 1, q: int = 0) -> int:
-        pass
+        """
+        Counts the labeled DAGs with n nodes (Tom's LDAG recurrence based on DAG codes.)
+        :param n: The number of nodes.
+        :param j: The position in the DAG code. (default: 1)
+        :param q: The number of nodes seen so far. (default: 0)
+        :return: The number of labeled DAGs.
+        """
+        if j >= n:
+            return 1
+        if (n, j, q) not in self.__ldag:
+            count = 0
+            for s in range(q + 1):
+                for t in range(j - q + 1):
+                    count += self.binomial(q, s) * self.binomial(n - q, t) * self.count_ldag(n, j + 1, q + t)
+            self.__ldag[(n, j, q)] = count
+        return self.__ldag[(n, j, q)]
 
     def count_bounded_ldag(self, n: int, c: int, j: int = 1, q: int = 0) -> int:
-        pass
+        """
+        Counts the labeled DAGs with n nodes and indegree at most c.
+        :param n: The number of nodes.
+        :param c: The bound on indegree.
+        :param j: The position in the DAG code. (default: 1)
+        :param q: The number of nodes seen so far. (default: 0)
+        :return: The number of labeled DAGs with bounded indegree.
+        """
+        if j >= n:
+            return 1
+        if (n, c, j, q) not in self.__bldag:
+            count = 0
+            for s in range(min(c, q) + 1):
+                for t in range(min(c - s, j - q) + 1):
+                    count += (self.binomial(q, s) * self.binomial(n - q, t)
+                              * self.count_bounded_ldag(n, c, j + 1, q + t))
+            self.__bldag[(n, c, j, q)] = count
+        return self.__bldag[(n, c, j, q)]
 
     def count_cpnet(self, n: int, c: int|None = None, j: int = 0, q: int = 0) -> int:
+        """
+        Counts the CP-nets with n nodes and indegree at most c.
+        :param n: The number of nodes.
+        :param c: The bound on indegree. (default: n-1)
+        :param j: The position in the DAG code. (default: 0)
+        :param q: The number of nodes seen so far. (default: 0)
+        :return: The number of CP-nets.
+        """
         if c is None:
             c = n-1
-        pass
+        if j >= n:
+            return 1
+        if j <= 0:
+            return self.gamma(0) * self.count_cpnet(n, c, 1, 0)
+        if (n, c, j, q) not in self.__cpnet:
+            count = 0
+            for s in range(min(c, q) + 1):
+                for t in range(min(c - s, j - q) + 1):
+                    count += (self.gamma(s + t) * self.binomial(q, s) * self.binomial(n - q, t)
+                              * self.count_cpnet(n, c, j + 1, q + t))
+            self.__cpnet[(n, c, j, q)] = count
+        return self.__cpnet[(n, c, j, q)]
 
     def prob_cpnet(self, n: int, c: int|None = None) -> int:
         if c is None:
             c = n-1
-        return get_cpnet_cdf(n, c)
+        return self.get_cpnet_cdf(n, c)
 
     def get_cpnet_cdf(self, n: int, c: int, j: int = 1, q: int = 1) -> int:
         pass
 
     def init(self):
-        pass
+        """
+        (Re)initializes the memoization tables.
+        """
+        self.__gamma: dict[int, int] = dict()
+        self.__ldag: dict[tuple[int, int, int], int] = dict()
+        self.__bldag: dict[tuple[int, int, int, int], int] = dict()
+        self.__cpnet: dict[tuple[int, int, int, int], int] = dict()
 
     def print_pascal(self):
-        pass
+        for n in range(self.__max_n):
+            print(" ".join(str(self.binomial(n, k)) for k in range(min(n, self.__max_k - 1) + 1)))
@@ -0,0 +1,253 @@
+# File: queries.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2025
+# License: GNU GPLv3
+# Created On: 19 Oct 2026
+# Purpose:
+#   Vectorized queries (optimal outcomes, best completions, ordering queries) over batches of acyclic CP-nets.
+# Notes:
+#   CPTs are flattened into arrays indexed by mixed-radix row numbers: the row of an assignment to the parents
+#       (p_0, ..., p_{k-1}) is sum(p_j * d^(k-1-j)), the same order itertools.product generates rows in.
+#   Missing CPT rows (incompleteness) are stored as -1. Feature values of -1 in outcomes mean "unassigned."
+#   All CP-nets in a batch must share the number of features and the domain size, indegrees may differ.
+#   VirtualCPTs with more than MAX_DENSE_ROWS rows are never flattened (that would undo their point): during a query
+#       only the rows actually gathered are computed, through VirtualCPT.row_order. This is a per-CP-net Python loop
+#       over the distinct rows used, so such batches are slower than fully flattened ones.
+
+from .alternative import Alternative
+from .cpnet import CPNet, VirtualCPT
+import numpy as np
+
+
+class CPNetBatch:
+    """Class for holding a batch of CP-nets as arrays, so queries can be answered for all of them at once."""
+    # Largest VirtualCPT (in rows) which is flattened, bigger ones are evaluated lazily.
+    MAX_DENSE_ROWS = 4096
+
+    def __init__(self, nets: list[CPNet]):
+        """
+        Constructor for the CPNetBatch class. Flattens the CPT of every node of every CP-net.
+        :param nets: A non-empty list of CP-nets with identical numbers of features and domain sizes.
+        """
+        if len(nets) == 0:
+            raise ValueError("Cannot build a batch out of zero CP-nets.")
+        features = nets[0].size()
+        dom_size = nets[0].domain().feature_domain_size()
+        for net in nets:
+            if net.size() != features or net.domain().feature_domain_size() != dom_size:
+                raise ValueError("All CP-nets in a batch must have the same features and domain size.")
+        indegree = max(len(node.parents()) for net in nets for node in net.nodes())
+        self.__features = features
+        self.__dom_size = dom_size
+        # lazy[b, attr] marks large virtual CPTs, kept in lazy_cpts[(b, attr)] rather than in ranks/tops.
+        self.__lazy = np.zeros((len(nets), features), dtype=bool)
+        self.__lazy_cpts: dict[tuple[int, int], VirtualCPT] = dict()
+        dense_indegree = 0
+        for net_idx, net in enumerate(nets):
+            for node in net.nodes():
+                cpt = node.cpt()
+                if isinstance(cpt, VirtualCPT) and dom_size ** cpt.indegree() > CPNetBatch.MAX_DENSE_ROWS:
+                    self.__lazy[net_idx, node.attr()] = True
+                    self.__lazy_cpts[(net_idx, node.attr())] = cpt
+                else:
+                    dense_indegree = max(dense_indegree, cpt.indegree())
+        # Padded parents have a weight of 0, so they never contribute to a row index.
+        self.__parents = np.zeros((len(nets), features, indegree), dtype=np.int64)
+        self.__weights = np.zeros((len(nets), features, indegree), dtype=np.int64)
+        self.__order = np.array([net.topological_order() for net in nets], dtype=np.int64)
+        # ranks[b, attr, row, val] is the position of val in the order of that row, tops[b, attr, row] is the best val.
+        self.__ranks = np.full((len(nets), features, dom_size ** dense_indegree, dom_size), -1, dtype=np.int16)
+        self.__tops = np.full((len(nets), features, dom_size ** dense_indegree), -1, dtype=np.int16)
+        for net_idx, net in enumerate(nets):
+            for node in net.nodes():
+                attr = node.attr()
+                parents = node.parents()
+                weights = [dom_size ** (len(parents) - 1 - idx) for idx in range(len(parents))]
+                self.__parents[net_idx, attr, :len(parents)] = parents
+                self.__weights[net_idx, attr, :len(parents)] = weights
+                if self.__lazy[net_idx, attr]:
+                    continue
+                for key, order in node.cpt().rows():
+                    row = 0 if key == 'default' else sum(val * weight for val, weight in zip(key, weights))
+                    self.__ranks[net_idx, attr, row, list(order)] = np.arange(dom_size)
+                    self.__tops[net_idx, attr, row] = order[0]
+
+    def size(self) -> int:
+        """
+        Gets the number of CP-nets in the batch.
+        :return: The number of CP-nets in the batch.
+        """
+        return self.__order.shape[0]
+
+    def features(self) -> int:
+        return self.__features
+
+    def best_completions(self, partials: np.ndarray) -> np.ndarray:
+        """
+        Finds the best completion of each partial assignment in each CP-net via a forward sweep.
+        :param partials: An integer array of shape (Q, n), -1 marks unassigned features.
+        :return: An integer array of shape (B, Q, n). Features whose best value is not determined (the CPT row is
+            missing) are left as -1, as are any descendants depending on them.
+        """
+        partials = np.asarray(partials, dtype=np.int64)
+        self.__check_outcomes(partials, True)
+        nets = np.arange(self.size())
+        # Work with features on the middle axis, so each gather copies whole contiguous rows of Q values.
+        result = np.broadcast_to(partials.T, (self.size(),) + partials.T.shape).copy()
+        for step in range(self.__features):
+            attr = self.__order[:, step]
+            values, rows = self.__parent_rows(result, nets, attr)
+            known = ((values >= 0) | (self.__weights[nets, attr] == 0)[:, :, None]).all(axis=1)
+            top = np.where(known, self.__lookup_tops(nets, attr, rows), -1)
+            current = result[nets, attr]
+            result[nets, attr] = np.where(current >= 0, current, top)
+        return result.transpose(0, 2, 1)
+
+    def optimal_outcomes(self) -> np.ndarray:
+        """
+        Finds the optimal outcome of each CP-net via a forward sweep.
+        :return: An integer array of shape (B, n). See best_completions for the meaning of -1 entries.
+        """
+        return self.best_completions(np.full((1, self.__features), -1, dtype=np.int64))[:, 0, :]
+
+    def ordering_queries(self, better: np.ndarray, worse: np.ndarray) -> np.ndarray:
+        """
+        Answers ordering queries: can better be ranked above worse, i.e. is it certain that worse does not dominate
+        better? Uses the sufficient condition of Boutilier et al. (2004): some feature X has all ancestors assigned
+        identically in both outcomes, and given the (shared) parent values better assigns a more preferred value to X.
+        :param better: An integer array of complete outcomes, shape (Q, n).
+        :param worse: An integer array of complete outcomes, shape (Q, n).
+        :return: A boolean array of shape (B, Q). True if the CP-net does not entail worse > better, False if
+            undetermined (no witness was found, which does not imply worse > better.)
+        """
+        better = np.asarray(better, dtype=np.int64)
+        worse = np.asarray(worse, dtype=np.int64)
+        self.__check_outcomes(better, False)
+        self.__check_outcomes(worse, False)
+        if better.shape != worse.shape:
+            raise ValueError("Ordering queries require the same number of better and worse outcomes.")
+        nets = np.arange(self.size())
+        better = better.T
+        worse = worse.T
+        # agreed[b, X, q] is true iff X and all of its ancestors are assigned identically by both outcomes.
+        agreed = np.broadcast_to(better == worse, (self.size(),) + better.shape).copy()
+        witness = np.zeros((self.size(), better.shape[1]), dtype=bool)
+        for step in range(self.__features):
+            attr = self.__order[:, step]
+            padded = (self.__weights[nets, attr] == 0)[:, :, None]
+            ancestors = (agreed[nets[:, None], self.__parents[nets, attr]] | padded).all(axis=1)
+            agreed[nets, attr] &= ancestors
+            _, rows = self.__parent_rows(better[None], nets, attr)
+            better_rank, worse_rank = self.__lookup_ranks(nets, attr, rows, better[attr], worse[attr])
+            witness |= ancestors & (better_rank < worse_rank)
+        return witness
+
+    def __parent_rows(self, outcomes: np.ndarray, nets: np.ndarray, attr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gathers the parent values of one attribute per CP-net and computes their CPT row indices.
+        :param outcomes: An integer array of shape (B, n, Q), or (1, n, Q) when shared by all CP-nets.
+        :param nets: The array [0, ..., B-1].
+        :param attr: The attribute to consider for each CP-net, shape (B,).
+        :return: The parent values, shape (B, c, Q), and the row indices, shape (B, Q).
+        """
+        sources = nets[:, None] if outcomes.shape[0] > 1 else 0
+        values = outcomes[sources, self.__parents[nets, attr]]
+        rows = (np.maximum(values, 0) * self.__weights[nets, attr][:, :, None]).sum(axis=1)
+        return values, rows
+
+    def __lookup_tops(self, nets: np.ndarray, attr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """
+        Looks up the best value of the given CPT rows, computing the rows of lazy CPTs on demand.
+        :param nets: The array [0, ..., B-1].
+        :param attr: The attribute to consider for each CP-net, shape (B,).
+        :param rows: The CPT row of each query, shape (B, Q).
+        :return: The best values (-1 for missing rows), shape (B, Q).
+        """
+        lazy = self.__lazy[nets, attr]
+        tops = self.__tops[nets[:, None], attr[:, None], np.where(lazy[:, None], 0, rows)]
+        for net_idx in np.flatnonzero(lazy):
+            unique, inverse = np.unique(rows[net_idx], return_inverse=True)
+            orders = [self.__lazy_cpts[(int(net_idx), int(attr[net_idx]))].row_order(row) for row in unique]
+            tops[net_idx] = np.array([-1 if order is None else order[0] for order in orders])[inverse]
+        return tops
+
+    def __lookup_ranks(self, nets: np.ndarray, attr: np.ndarray, rows: np.ndarray, *values: np.ndarray) \
+            -> tuple[np.ndarray, ...]:
+        """
+        Looks up the rank of values in the given CPT rows, computing the rows of lazy CPTs on demand.
+        :param nets: The array [0, ..., B-1].
+        :param attr: The attribute to consider for each CP-net, shape (B,).
+        :param rows: The CPT row of each query, shape (B, Q).
+        :param values: Arrays of values of attr, shape (B, Q).
+        :return: One array of ranks (-1 for missing rows) per array of values, shape (B, Q).
+        """
+        lazy = self.__lazy[nets, attr]
+        safe_rows = np.where(lazy[:, None], 0, rows)
+        ranks = [self.__ranks[nets[:, None], attr[:, None], safe_rows, vals] for vals in values]
+        for net_idx in np.flatnonzero(lazy):
+            unique, inverse = np.unique(rows[net_idx], return_inverse=True)
+            table = np.full((len(unique), self.__dom_size), -1, dtype=np.int16)
+            for idx, row in enumerate(unique):
+                order = self.__lazy_cpts[(int(net_idx), int(attr[net_idx]))].row_order(row)
+                if order is not None:
+                    table[idx, list(order)] = np.arange(self.__dom_size)
+            for rank, vals in zip(ranks, values):
+                rank[net_idx] = table[inverse, vals[net_idx]]
+        return tuple(ranks)
+
+    def __check_outcomes(self, outcomes: np.ndarray, partial: bool):
+        """
+        Checks the shape and values of outcomes given to a query.
+        :param outcomes: An integer array which should have shape (Q, n).
+        :param partial: If true -1 (unassigned) is allowed as a value.
+        """
+        if outcomes.ndim != 2 or outcomes.shape[1] != self.__features:
+            raise ValueError(f"Outcomes must have shape (Q, {self.__features}), got {outcomes.shape}.")
+        lowest = -1 if partial else 0
+        if outcomes.size > 0 and (outcomes.min() < lowest or outcomes.max() >= self.__dom_size):
+            raise ValueError(f"Outcome values must be in the range [{lowest}, {self.__dom_size}).")
+
+
+def as_outcome_array(alts: list[Alternative]) -> np.ndarray:
+    """
+    Converts a list of alternatives into an array suitable for batch queries.
+    :param alts: A list of Alternative objects of identical length.
+    :return: An integer array of shape (len(alts), n).
+    """
+    return np.array([alt.as_tuple() for alt in alts], dtype=np.int64)
+
+
+def best_completions(nets: list[CPNet] | CPNetBatch, partials: np.ndarray) -> np.ndarray:
+    """
+    Finds the best completion of each partial assignment in each CP-net.
+    :param nets: A list of CP-nets, or an already built CPNetBatch (preferred when querying repeatedly.)
+    :param partials: An integer array of shape (Q, n), -1 marks unassigned features.
+    :return: An integer array of shape (B, Q, n).
+    """
+    if not isinstance(nets, CPNetBatch):
+        nets = CPNetBatch(nets)
+    return nets.best_completions(partials)
+
+
+def optimal_outcomes(nets: list[CPNet] | CPNetBatch) -> np.ndarray:
+    """
+    Finds the optimal outcome of each CP-net.
+    :param nets: A list of CP-nets, or an already built CPNetBatch.
+    :return: An integer array of shape (B, n).
+    """
+    if not isinstance(nets, CPNetBatch):
+        nets = CPNetBatch(nets)
+    return nets.optimal_outcomes()
+
+
+def ordering_queries(nets: list[CPNet] | CPNetBatch, better: np.ndarray, worse: np.ndarray) -> np.ndarray:
+    """
+    Answers ordering queries (does worse fail to dominate better?) for each pair of outcomes in each CP-net.
+    :param nets: A list of CP-nets, or an already built CPNetBatch.
+    :param better: An integer array of complete outcomes, shape (Q, n).
+    :param worse: An integer array of complete outcomes, shape (Q, n).
+    :return: A boolean array of shape (B, Q). True if the CP-net does not entail worse > better, False if undetermined.
+    """
+    if not isinstance(nets, CPNetBatch):
+        nets = CPNetBatch(nets)
+    return nets.ordering_queries(better, worse)
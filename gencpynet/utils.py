@@ -30,4 +30,58 @@ def random_k_subset(set_size: int, subset_size: int) -> list[int]:
         # If done early break
         if selected == subset_size:
             break
-    return result
\ No newline at end of file
+    return result
+
+# SplitMix64 (Steele, Lea, Flood 2014), used as a counter-based generator: output i of stream (seed, counter) is a pure
+# function of its inputs, so any value can be recomputed on demand without storing generator state.
+_MASK_64 = (1 << 64) - 1
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+
+def splitmix64(value: int) -> int:
+    """
+    The SplitMix64 output function.
+    :param value: An integer, only the low 64 bits are used.
+    :return: A well mixed 64 bit integer.
+    """
+    value = (value + _GOLDEN_64) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+def counter_random(seed: int, counter: int, draw: int) -> int:
+    """
+    Computes the draw-th 64 bit random number of the stream keyed by (seed, counter).
+    :param seed: The key of the generator.
+    :param counter: The stream number (e.g. a CPT row.)
+    :param draw: The position in the stream.
+    :return: A 64 bit integer.
+    """
+    return splitmix64(splitmix64(seed ^ splitmix64(counter)) + draw * _GOLDEN_64)
+
+
+def counter_uniform(seed: int, counter: int, draw: int) -> float:
+    """
+    Computes the draw-th uniform number in [0, 1) of the stream keyed by (seed, counter).
+    :param seed: The key of the generator.
+    :param counter: The stream number.
+    :param draw: The position in the stream.
+    :return: A float in [0, 1).
+    """
+    return (counter_random(seed, counter, draw) >> 11) / float(1 << 53)
+
+
+def counter_permutation(seed: int, counter: int, size: int, first_draw: int = 0) -> tuple[int,...]:
+    """
+    Computes a uniformly random permutation of range(size) from the stream keyed by (seed, counter) (Fisher-Yates.)
+    :param seed: The key of the generator.
+    :param counter: The stream number.
+    :param size: The number of items to permute.
+    :param first_draw: The position in the stream of the first draw used. (default: 0)
+    :return: A tuple holding the permutation.
+    """
+    perm = list(range(size))
+    for idx in range(size - 1, 0, -1):
+        swap = (counter_random(seed, counter, first_draw + idx) * (idx + 1)) >> 64
+        perm[idx], perm[swap] = perm[swap], perm[idx]
+    return tuple(perm)